@@ -14,173 +14,77 @@ Options:
 """
 
 import argparse
+import functools
+import json
+import os
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Callable
-from typing import Dict
+from pathlib import PurePosixPath
+from typing import List
+from typing import Optional
+from typing import Set
 from typing import Tuple
 
-from rich.align import Align
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-
-
-class ProjectSetup:
-    """Handles the creation of project directory structure and initial files."""
-
-    def __init__(self, root_path: Path, force: bool = False, dry_run: bool = False):
-        self.root_path = Path(root_path).resolve()
-        self.force = force
-        self.dry_run = dry_run
-        self.created_files = []
-        self.created_dirs = []
-        self.console = Console()
-
-    def create_directory_structure(self) -> None:
-        """Create the complete directory structure."""
-
-        directories = [
-            # Main source directories
-            "src/videomilker/cli",
-            "src/videomilker/core",
-            "src/videomilker/config",
-            "src/videomilker/history",
-            "src/videomilker/utils",
-            "src/videomilker/exceptions",
-            # Test directories
-            "tests/test_cli",
-            "tests/test_core",
-            "tests/test_config",
-            "tests/test_utils",
-            # Documentation
-            "docs",
-            # Configuration
-            "config/themes",
-            "config/templates",
-            # Data directories
-            "data/downloads",
-            "data/history",
-            "data/logs",
-            "data/temp",
-            # Utility scripts
-            "scripts",
-            # Assets
-            "assets/icons",
-            "assets/templates",
-            # Build directories
-            "build/dist",
-            "build/exe",
-            "build/temp",
-        ]
-
-        for directory in directories:
-            self._create_directory(directory)
-
-    def create_initial_files(self) -> None:
-        """Create initial project files with basic content."""
-
-        # Root level files
-        self._create_file(".gitignore", self._get_gitignore_content())
-        self._create_file("README.md", self._get_readme_content())
-        self._create_file("requirements.txt", self._get_requirements_content())
-        self._create_file("setup.py", self._get_setup_py_content())
-        self._create_file("pyproject.toml", self._get_pyproject_content())
-        self._create_file("LICENSE", self._get_license_content())
-
-        # Python __init__.py files
-        init_files = [
-            "src/__init__.py",
-            "src/videomilker/__init__.py",
-            "src/videomilker/cli/__init__.py",
-            "src/videomilker/core/__init__.py",
-            "src/videomilker/config/__init__.py",
-            "src/videomilker/history/__init__.py",
-            "src/videomilker/utils/__init__.py",
-            "src/videomilker/exceptions/__init__.py",
-            "tests/__init__.py",
-            "tests/test_cli/__init__.py",
-            "tests/test_core/__init__.py",
-            "tests/test_config/__init__.py",
-            "tests/test_utils/__init__.py",
-        ]
-
-        for init_file in init_files:
-            self._create_file(init_file, self._get_init_content(init_file))
-
-        # Main application files
-        self._create_file("src/videomilker/main.py", self._get_main_py_content())
-        self._create_file("src/videomilker/version.py", self._get_version_content())
-
-        # CLI module files
-        self._create_file("src/videomilker/cli/menu_system.py", self._get_menu_system_content())
-        self._create_file("src/videomilker/cli/menu_renderer.py", self._get_menu_renderer_content())
-        self._create_file("src/videomilker/cli/styles.py", self._get_styles_content())
-
-        # Core module files
-        self._create_file("src/videomilker/core/downloader.py", self._get_downloader_content())
-        self._create_file("src/videomilker/core/file_manager.py", self._get_file_manager_content())
-
-        # Configuration files
-        self._create_file("src/videomilker/config/settings.py", self._get_settings_content())
-        self._create_file("config/default_config.json", self._get_default_config_content())
-
-        # Test configuration
-        self._create_file("tests/conftest.py", self._get_conftest_content())
-
-        # Documentation files
-        self._create_file("docs/README.md", self._get_docs_readme_content())
-        self._create_file("docs/installation.md", self._get_installation_content())
-
-        # Data placeholder files
-        self._create_file("data/downloads/.gitkeep", "")
-        self._create_file("data/history/.gitkeep", "")
-        self._create_file("data/logs/.gitkeep", "")
-        self._create_file("data/temp/.gitkeep", "")
-
-    def _create_directory(self, path: str) -> None:
-        """Create a directory if it doesn't exist."""
-        full_path = self.root_path / path
-
-        if self.dry_run:
-            print(f"[DRY RUN] Would create directory: {full_path}")
-            return
-
-        if not full_path.exists():
-            full_path.mkdir(parents=True, exist_ok=True)
-            self.created_dirs.append(str(full_path))
-            print(f" Created directory: {path}")
-        else:
-            print(f"• Directory exists: {path}")
-
-    def _create_file(self, path: str, content: str) -> None:
-        """Create a file with the given content."""
-        full_path = self.root_path / path
 
-        if self.dry_run:
-            print(f"[DRY RUN] Would create file: {full_path}")
-            return
-
-        if full_path.exists() and not self.force:
-            print(f"• File exists (skipping): {path}")
-            return
+# Project layout created by the setup run
+_DIRECTORIES: Tuple[str, ...] = (
+    # Main source directories
+    "src/videomilker/cli",
+    "src/videomilker/core",
+    "src/videomilker/config",
+    "src/videomilker/history",
+    "src/videomilker/utils",
+    "src/videomilker/exceptions",
+    # Test directories
+    "tests/test_cli",
+    "tests/test_core",
+    "tests/test_config",
+    "tests/test_utils",
+    # Documentation
+    "docs",
+    # Configuration
+    "config/themes",
+    "config/templates",
+    # Data directories
+    "data/downloads",
+    "data/history",
+    "data/logs",
+    "data/temp",
+    # Utility scripts
+    "scripts",
+    # Assets
+    "assets/icons",
+    "assets/templates",
+    # Build directories
+    "build/dist",
+    "build/exe",
+    "build/temp",
+)
 
-        # Ensure parent directory exists
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+_INIT_FILES: Tuple[str, ...] = (
+    "src/__init__.py",
+    "src/videomilker/__init__.py",
+    "src/videomilker/cli/__init__.py",
+    "src/videomilker/core/__init__.py",
+    "src/videomilker/config/__init__.py",
+    "src/videomilker/history/__init__.py",
+    "src/videomilker/utils/__init__.py",
+    "src/videomilker/exceptions/__init__.py",
+    "tests/__init__.py",
+    "tests/test_cli/__init__.py",
+    "tests/test_core/__init__.py",
+    "tests/test_config/__init__.py",
+    "tests/test_utils/__init__.py",
+)
 
-        try:
-            with open(full_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            self.created_files.append(str(full_path))
-            print(f" Created file: {path}")
-        except Exception as e:
-            print(f" Failed to create {path}: {e}")
+# Evaluated once per run; the year cannot change meaningfully during setup
+_CURRENT_YEAR = datetime.now().year
 
-    # Content generation methods
-    def _get_gitignore_content(self) -> str:
-        return """# Byte-compiled / optimized / DLL files
+# Static file contents written by the setup run, pre-encoded to UTF-8 bytes
+_GITIGNORE_CONTENT = b"""# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -262,8 +166,7 @@ config/user_config.json
 *.sqlite
 """
 
-    def _get_readme_content(self) -> str:
-        return """# VideoMilker
+_README_CONTENT = b"""# VideoMilker
 
 An intuitive CLI interface for yt-dlp that simplifies video downloading with organized workflows.
 
@@ -291,15 +194,13 @@ See the `docs/` directory for detailed documentation.
 This project is licensed under the MIT License - see the LICENSE file for details.
 """
 
-    def _get_requirements_content(self) -> str:
-        return """# Core dependencies
+_REQUIREMENTS_CONTENT = b"""# Core dependencies
 rich>=13.0.0
 click>=8.0.0
 yt-dlp>=2023.12.30
 pathlib2>=2.3.0
 
 # Configuration and data
-pydantic>=2.0.0
 toml>=0.10.0
 
 # Database and history
@@ -323,8 +224,7 @@ build>=0.10.0
 twine>=4.0.0
 """
 
-    def _get_setup_py_content(self) -> str:
-        return '''#!/usr/bin/env python3
+_SETUP_PY_CONTENT = b'''#!/usr/bin/env python3
 """VideoMilker setup configuration."""
 
 from setuptools import setup, find_packages
@@ -355,7 +255,6 @@ setup(
         "rich>=13.0.0",
         "click>=8.0.0",
         "yt-dlp>=2023.12.30",
-        "pydantic>=2.0.0",
         "toml>=0.10.0",
     ],
     extras_require={
@@ -366,7 +265,10 @@ setup(
             "isort>=5.12.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
-        ]
+        ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -390,8 +292,7 @@ setup(
 )
 '''
 
-    def _get_pyproject_content(self) -> str:
-        return """[build-system]
+_PYPROJECT_CONTENT = b"""[build-system]
 requires = ["setuptools>=65.0", "wheel"]
 build-backend = "setuptools.build_meta"
 
@@ -424,7 +325,6 @@ dependencies = [
     "rich>=13.0.0",
     "click>=8.0.0", 
     "yt-dlp>=2023.12.30",
-    "pydantic>=2.0.0",
     "toml>=0.10.0",
 ]
 
@@ -437,6 +337,9 @@ dev = [
     "flake8>=6.0.0",
     "mypy>=1.0.0",
 ]
+fast = [
+    "orjson>=3.9.0",
+]
 
 [project.scripts]
 videomilker = "videomilker.main:main"
@@ -467,53 +370,7 @@ warn_unused_configs = true
 disallow_untyped_defs = true
 """
 
-    def _get_license_content(self) -> str:
-        year = datetime.now().year
-        return f"""MIT License
-
-Copyright (c) {year} VideoMilker Team
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-"""
-
-    def _get_init_content(self, file_path: str) -> str:
-        """Generate appropriate __init__.py content based on the module."""
-        if "videomilker/__init__.py" in file_path:
-            return '''"""VideoMilker - An intuitive CLI interface for yt-dlp."""
-
-from .version import __version__
-
-__all__ = ["__version__"]
-'''
-        elif "cli/__init__.py" in file_path:
-            return '''"""CLI interface components."""
-
-from .menu_system import MenuSystem
-from .menu_renderer import MenuRenderer
-
-__all__ = ["MenuSystem", "MenuRenderer"]
-'''
-        else:
-            return '"""Package initialization."""\n'
-
-    def _get_main_py_content(self) -> str:
-        return '''#!/usr/bin/env python3
+_MAIN_PY_CONTENT = b'''#!/usr/bin/env python3
 """
 VideoMilker main entry point.
 
@@ -576,8 +433,7 @@ if __name__ == "__main__":
     main()
 '''
 
-    def _get_version_content(self) -> str:
-        return '''"""Version information for VideoMilker."""
+_VERSION_CONTENT = b'''"""Version information for VideoMilker."""
 
 __version__ = "1.0.0"
 __version_info__ = tuple(int(i) for i in __version__.split("."))
@@ -587,8 +443,7 @@ __build__ = "dev"
 __date__ = "2024-01-15"
 '''
 
-    def _get_menu_system_content(self) -> str:
-        return '''"""Main menu system for VideoMilker CLI."""
+_MENU_SYSTEM_CONTENT = b'''"""Main menu system for VideoMilker CLI."""
 
 from typing import Optional, Dict, Any
 from rich.console import Console
@@ -696,8 +551,7 @@ class MenuSystem:
         self.current_menu = "main"
 '''
 
-    def _get_menu_renderer_content(self) -> str:
-        return '''"""Menu rendering utilities using Rich."""
+_MENU_RENDERER_CONTENT = b'''"""Menu rendering utilities using Rich."""
 
 from typing import Dict, Tuple, Callable, Optional
 from rich.console import Console
@@ -715,35 +569,7 @@ class MenuRenderer:
         self.console = console
 '''
 
-    def _get_default_config_content(self) -> str:
-        home = str(Path.home())
-        return f"""{{
-  "version": "1.0.0",
-  "download": {{
-    "path": "{home}/Downloads/VideoMilker",
-    "create_day_folders": true,
-    "file_naming": "%(upload_date)s_%(title)s",
-    "default_quality": "best",
-    "default_format": "mp4",
-    "max_concurrent": 3,
-    "auto_subtitle": false,
-    "save_thumbnail": false
-  }},
-  "ui": {{
-    "theme": "default",
-    "show_progress_details": true,
-    "confirm_before_quit": true,
-    "clear_screen": true
-  }},
-  "history": {{
-    "max_entries": 1000,
-    "auto_cleanup": true,
-    "cleanup_days": 30
-  }}
-}}"""
-
-    def _get_conftest_content(self) -> str:
-        return '''"""Pytest configuration and fixtures."""
+_CONFTEST_CONTENT = b'''"""Pytest configuration and fixtures."""
 
 import pytest
 from pathlib import Path
@@ -801,8 +627,7 @@ def mock_ytdlp_failure(monkeypatch):
     monkeypatch.setattr("subprocess.run", mock_run)
 '''
 
-    def _get_docs_readme_content(self) -> str:
-        return """# VideoMilker Documentation
+_DOCS_README_CONTENT = b"""# VideoMilker Documentation
 
 Welcome to the VideoMilker documentation. This directory contains comprehensive guides and references for using and developing VideoMilker.
 
@@ -841,8 +666,7 @@ If you need help or have questions:
 We welcome contributions! Please read our [Contributing Guide](contributing.md) to get started.
 """
 
-    def _get_installation_content(self) -> str:
-        return """# Installation Guide
+_INSTALLATION_CONTENT = b"""# Installation Guide
 
 This guide covers how to install and set up VideoMilker on your system.
 
@@ -858,6 +682,9 @@ This guide covers how to install and set up VideoMilker on your system.
 
 ```bash
 pip install videomilker
+
+# Optional: faster JSON parsing with orjson
+pip install "videomilker[fast]"
 ```
 
 ### Option 2: From Source
@@ -926,7 +753,6 @@ VideoMilker automatically installs:
 - `yt-dlp` - Video downloading engine
 - `rich` - Terminal UI library
 - `click` - Command-line interface framework
-- `pydantic` - Data validation
 - `toml` - Configuration file support
 
 ## Troubleshooting
@@ -959,110 +785,7 @@ If you encounter issues:
 - Explore [Advanced Features](user_guide.md#advanced-features)
 """
 
-    def run_setup(self) -> None:
-        """Run the complete project setup."""
-        print(" Setting up VideoMilker project structure...")
-        print(f"Root directory: {self.root_path}")
-        print()
-
-        try:
-            # Create directory structure
-            print(" Creating directory structure...")
-            self.create_directory_structure()
-            print()
-
-            # Create files
-            print(" Creating initial files...")
-            self.create_initial_files()
-            print()
-
-            # Summary
-            print(" Project setup completed successfully!")
-            print(f"Created {len(self.created_dirs)} directories")
-            print(f"Created {len(self.created_files)} files")
-
-            if not self.dry_run:
-                print()
-                print(" Next Steps:")
-                print("1. Navigate to the project directory:")
-                print(f"   cd {self.root_path}")
-                print("2. Activate virtual environment:")
-                print("   source .venv/bin/activate  # Linux/Mac")
-                print("   .venv\\Scripts\\activate     # Windows")
-                print("3. Install dependencies:")
-                print("   pip install -r requirements.txt")
-                print("4. Run the application:")
-                print("   python -m src.videomilker.main")
-
-        except Exception as e:
-            print(f" Setup failed: {e}")
-            if self.dry_run:
-                print("(This was a dry run - no files were actually created)")
-            sys.exit(1)
-
-    def cleanup_old_files(self, days_to_keep: int = 30) -> int:
-        """Clean up files older than specified days."""
-        cutoff_date = datetime.now().timestamp() - (days_to_keep * 24 * 3600)
-        cleaned_count = 0
-
-        for day_folder in self.base_path.iterdir():
-            if not day_folder.is_dir():
-                continue
-
-            for file_path in day_folder.rglob("*"):
-                if file_path.is_file():
-                    try:
-                        if file_path.stat().st_mtime < cutoff_date:
-                            file_path.unlink()
-                            cleaned_count += 1
-                    except OSError:
-                        continue
-
-            # Remove empty directories
-            try:
-                if not any(day_folder.iterdir()):
-                    day_folder.rmdir()
-            except OSError:
-                continue
-
-        return cleaned_count
-
-    def show_welcome_banner(self) -> None:
-        """Display the welcome banner."""
-        banner_text = Text("Welcome to VideoMilker!", style="bold blue")
-        banner = Panel(Align.center(banner_text), style="blue", padding=(1, 2))
-        self.console.print(banner)
-        self.console.print()
-
-    def show_menu(self, title: str, options: Dict[str, Tuple[str, Callable]]) -> str:
-        """Display a menu and get user input."""
-        # Create menu table
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Option", style="cyan", width=4)
-        table.add_column("Description", style="white")
-
-        for key, (description, _) in options.items():
-            table.add_row(f"[{key}]", description)
-
-        # Display menu in panel
-        menu_panel = Panel(table, title=title, title_align="center", style="blue")
-
-        self.console.print(menu_panel)
-
-        # Get user input
-        while True:
-            try:
-                choice = self.console.input("\\nSelect an option: ").strip().lower()
-                if choice in options:
-                    return choice
-                else:
-                    self.console.print("[red]Invalid option. Please try again.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                return "q"
-
-    def _get_styles_content(self) -> str:
-        """Generate content for the styles module."""
-        return '''"""Rich styles and themes for VideoMilker CLI."""
+_STYLES_CONTENT = b'''"""Rich styles and themes for VideoMilker CLI."""
 
 from rich.style import Style
 from rich.theme import Theme
@@ -1100,14 +823,17 @@ VIDEOMILKER_THEME = Theme({
 })
 '''
 
-    def _get_downloader_content(self) -> str:
-        """Generate content for the downloader module."""
-        return '''"""Core download functionality using yt-dlp."""
+_DOWNLOADER_CONTENT = b'''"""Core download functionality using yt-dlp."""
 
+import asyncio
+import os
+import re
 import subprocess
 import json
+import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -1116,6 +842,17 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeEl
 
 from ..config.settings import DownloadSettings
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib parser
+    orjson = None
+
+# yt-dlp --newline progress lines look like "[download]  42.3% of ..."
+_PROGRESS_PATTERN = re.compile(r"\\[download\\]\\s+([\\d.]+)%")
+
+# Files yt-dlp writes next to the video that are never the download itself
+_SIDECAR_SUFFIXES = (".part", ".ytdl", ".info.json", ".jpg", ".png", ".webp", ".vtt", ".srt")
+
 
 @dataclass
 class DownloadResult:
@@ -1132,6 +869,16 @@ class VideoDownloader:
     def __init__(self, settings: DownloadSettings, console: Console):
         self.settings = settings
         self.console = console
+        # Flags that only depend on settings; built once, not per download
+        self._base_cmd = (
+            "yt-dlp",
+            "--format", settings.default_quality,
+            "--write-info-json",
+            "--write-thumbnail" if settings.save_thumbnail else "--no-write-thumbnail",
+            "--write-subs" if settings.auto_subtitle else "--no-write-subs",
+            "--newline",
+            "--no-mtime",
+        )
     
     def download_video(self, url: str, output_path: Optional[Path] = None) -> DownloadResult:
         """Download a video from the given URL."""
@@ -1141,18 +888,17 @@ class VideoDownloader:
         # Ensure output directory exists
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Build yt-dlp command
+        # Build yt-dlp command; yt-dlp prints the final path, including for
+        # videos it skips as already downloaded
         cmd = [
-            "yt-dlp",
-            "--format", self.settings.default_quality,
+            *self._base_cmd,
+            "--progress",
+            "--print", "after_move:filepath",
             "--output", str(output_path / self.settings.file_naming),
-            "--write-info-json",
-            "--write-thumbnail" if self.settings.save_thumbnail else "--no-write-thumbnail",
-            "--write-subs" if self.settings.auto_subtitle else "--no-write-subs",
-            "--newline",
-            url
+            url,
         ]
         
+        start_ts = time.time()
         try:
             with Progress(
                 SpinnerColumn(),
@@ -1161,24 +907,39 @@ class VideoDownloader:
                 TimeElapsedColumn(),
                 console=self.console
             ) as progress:
-                task = progress.add_task(f"Downloading {url}", total=None)
+                task = progress.add_task(f"Downloading {url}", total=100)
                 
-                result = subprocess.run(
+                # Stream output line by line so progress is real and memory
+                # stays bounded; only the tail is kept for error reporting
+                output_tail = deque(maxlen=20)
+                env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+                with subprocess.Popen(
                     cmd,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
                     text=True,
-                    check=True
-                )
+                    bufsize=1,
+                    env=env
+                ) as proc:
+                    for line in proc.stdout:
+                        match = _PROGRESS_PATTERN.search(line)
+                        if match:
+                            progress.update(task, completed=float(match.group(1)))
+                        else:
+                            output_tail.append(line)
+                
+                if proc.returncode != 0:
+                    raise subprocess.CalledProcessError(proc.returncode, cmd, stderr="".join(output_tail))
                 
-                progress.update(task, completed=True)
+                progress.update(task, completed=100)
             
-            # Parse output to find downloaded file
-            output_files = list(output_path.glob("*"))
-            if output_files:
+            # Use the path yt-dlp printed; fall back to the newest file if it printed none
+            downloaded_file = self._printed_file(output_tail) or self._find_new_file(output_path, start_ts)
+            if downloaded_file:
                 return DownloadResult(
                     success=True,
-                    file_path=output_files[0],
-                    metadata=self._parse_metadata(output_files[0])
+                    file_path=downloaded_file,
+                    metadata=self._parse_metadata(downloaded_file)
                 )
             else:
                 return DownloadResult(
@@ -1197,22 +958,129 @@ class VideoDownloader:
                 error_message=f"Unexpected error: {str(e)}"
             )
     
+    def download_videos(self, urls: List[str], output_path: Optional[Path] = None) -> List[DownloadResult]:
+        """Download several videos, running up to max_concurrent yt-dlp processes at once."""
+        if output_path is None:
+            output_path = Path(self.settings.path)
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TimeElapsedColumn(),
+            console=self.console
+        ) as progress:
+            return asyncio.run(self._download_batch(urls, output_path, progress))
+    
+    async def _download_batch(self, urls: List[str], output_path: Path, progress: Progress) -> List[DownloadResult]:
+        """Run one download coroutine per URL behind a shared semaphore."""
+        semaphore = asyncio.Semaphore(max(1, self.settings.max_concurrent))
+        results = await asyncio.gather(
+            *(self.download_video_async(url, output_path, semaphore, progress) for url in urls)
+        )
+        return list(results)
+    
+    async def download_video_async(
+        self, url: str, output_path: Path, semaphore: asyncio.Semaphore, progress: Progress
+    ) -> DownloadResult:
+        """Download a video without blocking the event loop."""
+        task = progress.add_task(f"Queued {url}", total=100)
+        # Concurrent downloads share a directory, so ask yt-dlp for the final
+        # path instead of guessing it from modification times
+        cmd = [
+            *self._base_cmd,
+            "--progress",
+            "--print", "after_move:filepath",
+            "--output", str(output_path / self.settings.file_naming),
+            url,
+        ]
+        
+        try:
+            async with semaphore:
+                progress.update(task, description=f"Downloading {url}")
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT
+                )
+                output_tail = deque(maxlen=20)
+                async for raw_line in proc.stdout:
+                    line = raw_line.decode(errors="replace")
+                    match = _PROGRESS_PATTERN.search(line)
+                    if match:
+                        progress.update(task, completed=float(match.group(1)))
+                    else:
+                        output_tail.append(line)
+                returncode = await proc.wait()
+        except Exception as e:
+            return DownloadResult(
+                success=False,
+                error_message=f"Unexpected error: {str(e)}"
+            )
+        
+        if returncode != 0:
+            return DownloadResult(
+                success=False,
+                error_message=f"Download failed: {''.join(output_tail)}"
+            )
+        
+        progress.update(task, completed=100)
+        downloaded_file = self._printed_file(output_tail)
+        if downloaded_file:
+            return DownloadResult(
+                success=True,
+                file_path=downloaded_file,
+                metadata=self._parse_metadata(downloaded_file)
+            )
+        return DownloadResult(
+            success=False,
+            error_message="No files were downloaded"
+        )
+    
+    @staticmethod
+    def _printed_file(output_lines: Sequence[str]) -> Optional[Path]:
+        """Return the last existing file path yt-dlp printed via --print after_move:filepath."""
+        for line in reversed(output_lines):
+            candidate = line.strip()
+            if candidate and os.path.isfile(candidate):
+                return Path(candidate)
+        return None
+    
+    def _find_new_file(self, output_path: Path, since: float) -> Optional[Path]:
+        """Return the newest media file written to output_path since the given time."""
+        newest_path = None
+        newest_mtime = since
+        
+        # One scandir pass; no Path objects or sorting for older downloads
+        with os.scandir(output_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(_SIDECAR_SUFFIXES) or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime >= newest_mtime:
+                    newest_path, newest_mtime = entry.path, mtime
+        
+        return Path(newest_path) if newest_path else None
+    
     def _parse_metadata(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Parse metadata from the downloaded file."""
         info_file = file_path.with_suffix('.info.json')
         if info_file.exists():
             try:
-                with open(info_file, 'r') as f:
-                    return json.load(f)
+                # info.json files are often hundreds of KB; orjson parses them much faster
+                raw = info_file.read_bytes()
+                return orjson.loads(raw) if orjson else json.loads(raw)
             except Exception:
                 pass
         return None
 '''
 
-    def _get_file_manager_content(self) -> str:
-        """Generate content for the file manager module."""
-        return '''"""File management utilities for VideoMilker."""
+_FILE_MANAGER_CONTENT = b'''"""File management utilities for VideoMilker."""
 
+import errno
+import os
+import re
 import shutil
 from pathlib import Path
 from typing import List, Optional
@@ -1220,6 +1088,20 @@ from datetime import datetime, timedelta
 
 from rich.console import Console
 
+# Day folders are named YYYY-MM-DD
+_DATE_FOLDER_PATTERN = re.compile(r"^(\\d{4})-(\\d{2})-(\\d{2})$")
+
+
+def _remove_tree(path: str) -> None:
+    """Delete a directory tree, using scandir's cached entry types instead of a stat per entry."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
 
 class FileManager:
     """Handles file operations and organization."""
@@ -1230,11 +1112,14 @@ class FileManager:
     
     def organize_by_date(self, file_path: Path) -> Path:
         """Organize files by date in day-based folders."""
-        if not file_path.exists():
+        # One stat answers both "does it exist" and "when was it modified"
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return file_path
         
         # Get file modification time
-        mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+        mtime = datetime.fromtimestamp(st.st_mtime)
         date_folder = mtime.strftime("%Y-%m-%d")
         
         # Create date folder
@@ -1244,7 +1129,13 @@ class FileManager:
         # Move file to date folder
         new_path = day_path / file_path.name
         if new_path != file_path:
-            shutil.move(str(file_path), str(new_path))
+            # Same filesystem is the common case: a single atomic rename
+            try:
+                os.replace(file_path, new_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(str(file_path), str(new_path))
             self.console.print(f"Moved {file_path.name} to {date_folder}/")
         
         return new_path
@@ -1254,99 +1145,510 @@ class FileManager:
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
         cleaned_count = 0
         
-        for day_folder in self.base_path.iterdir():
-            if not day_folder.is_dir():
-                continue
-            
-            # Check if folder name is a date
-            try:
-                folder_date = datetime.strptime(day_folder.name, "%Y-%m-%d")
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                
+                # Check if folder name is a date; skip anything that is not
+                match = _DATE_FOLDER_PATTERN.match(entry.name)
+                if not match:
+                    continue
+                try:
+                    folder_date = datetime(int(match[1]), int(match[2]), int(match[3]))
+                except ValueError:
+                    continue
+                
                 if folder_date < cutoff_date:
-                    shutil.rmtree(day_folder)
+                    _remove_tree(entry.path)
                     cleaned_count += 1
-                    self.console.print(f"Removed old folder: {day_folder.name}")
-            except ValueError:
-                # Not a date folder, skip
-                continue
+                    self.console.print(f"Removed old folder: {entry.name}")
         
         return cleaned_count
     
     def get_file_info(self, file_path: Path) -> dict:
         """Get information about a file."""
-        if not file_path.exists():
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return {}
         
-        stat = file_path.stat()
         return {
             "name": file_path.name,
-            "size": stat.st_size,
-            "modified": datetime.fromtimestamp(stat.st_mtime),
-            "created": datetime.fromtimestamp(stat.st_ctime),
+            "size": st.st_size,
+            "modified": datetime.fromtimestamp(st.st_mtime),
+            "created": datetime.fromtimestamp(st.st_ctime),
             "extension": file_path.suffix,
         }
 '''
 
-    def _get_settings_content(self) -> str:
-        """Generate content for the settings module."""
-        return '''"""Configuration settings for VideoMilker."""
+_SETTINGS_CONTENT = b'''"""Configuration settings for VideoMilker."""
 
 import json
+import sys
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass, asdict
-from pydantic import BaseModel, Field
+from typing import Any, Dict
+from dataclasses import dataclass, asdict, field, fields
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib parser
+    orjson = None
+
+# slots trim per-instance memory and attribute lookups, but need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _build(cls, data: Dict[str, Any]):
+    """Build a settings dataclass from a dict, checking field types by hand."""
+    values = {}
+    for item in fields(cls):
+        if item.name not in data:
+            continue
+        value = data[item.name]
+        if not isinstance(value, item.type):
+            raise ValueError(
+                f"{cls.__name__}.{item.name} must be {item.type.__name__}, got {type(value).__name__}"
+            )
+        values[item.name] = value
+    return cls(**values)
 
 
-class DownloadSettings(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class DownloadSettings:
     """Download configuration settings."""
-    path: str = Field(default="~/Downloads/VideoMilker", description="Download directory")
-    create_day_folders: bool = Field(default=True, description="Organize files by date")
-    file_naming: str = Field(default="%(upload_date)s_%(title)s", description="File naming pattern")
-    default_quality: str = Field(default="best", description="Default video quality")
-    default_format: str = Field(default="mp4", description="Default video format")
-    max_concurrent: int = Field(default=3, description="Maximum concurrent downloads")
-    auto_subtitle: bool = Field(default=False, description="Automatically download subtitles")
-    save_thumbnail: bool = Field(default=False, description="Save video thumbnails")
-
-
-class UISettings(BaseModel):
+    path: str = "~/Downloads/VideoMilker"  # Download directory
+    create_day_folders: bool = True  # Organize files by date
+    file_naming: str = "%(upload_date)s_%(title)s"  # File naming pattern
+    default_quality: str = "best"  # Default video quality
+    default_format: str = "mp4"  # Default video format
+    max_concurrent: int = 3  # Maximum concurrent downloads
+    auto_subtitle: bool = False  # Automatically download subtitles
+    save_thumbnail: bool = False  # Save video thumbnails
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class UISettings:
     """UI configuration settings."""
-    theme: str = Field(default="default", description="UI theme")
-    show_progress_details: bool = Field(default=True, description="Show detailed progress")
-    confirm_before_quit: bool = Field(default=True, description="Confirm before quitting")
-    clear_screen: bool = Field(default=True, description="Clear screen on startup")
+    theme: str = "default"  # UI theme
+    show_progress_details: bool = True  # Show detailed progress
+    confirm_before_quit: bool = True  # Confirm before quitting
+    clear_screen: bool = True  # Clear screen on startup
 
 
-class HistorySettings(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class HistorySettings:
     """History configuration settings."""
-    max_entries: int = Field(default=1000, description="Maximum history entries")
-    auto_cleanup: bool = Field(default=True, description="Auto-cleanup old entries")
-    cleanup_days: int = Field(default=30, description="Days to keep history")
+    max_entries: int = 1000  # Maximum history entries
+    auto_cleanup: bool = True  # Auto-cleanup old entries
+    cleanup_days: int = 30  # Days to keep history
 
 
-class Settings(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class Settings:
     """Main application settings."""
-    version: str = Field(default="1.0.0", description="Settings version")
-    download: DownloadSettings = Field(default_factory=DownloadSettings)
-    ui: UISettings = Field(default_factory=UISettings)
-    history: HistorySettings = Field(default_factory=HistorySettings)
-    
+    version: str = "1.0.0"  # Settings version
+    download: DownloadSettings = field(default_factory=DownloadSettings)
+    ui: UISettings = field(default_factory=UISettings)
+    history: HistorySettings = field(default_factory=HistorySettings)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Settings":
+        """Build settings from a parsed JSON dict."""
+        return cls(
+            version=str(data.get("version", "1.0.0")),
+            download=_build(DownloadSettings, data.get("download", {})),
+            ui=_build(UISettings, data.get("ui", {})),
+            history=_build(HistorySettings, data.get("history", {})),
+        )
+
     @classmethod
     def load_from_file(cls, file_path: Path) -> "Settings":
         """Load settings from a JSON file."""
         if file_path.exists():
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            return cls(**data)
+            raw = file_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            return cls.from_dict(data)
         return cls()
     
     def save_to_file(self, file_path: Path) -> None:
         """Save settings to a JSON file."""
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w') as f:
-            json.dump(asdict(self), f, indent=2, default=str)
+        data = asdict(self)
+        if orjson:
+            file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
 '''
 
+# __init__.py contents keyed by package directory
+_INIT_CONTENTS = {
+    "src/videomilker": b'''"""VideoMilker - An intuitive CLI interface for yt-dlp."""
+
+from .version import __version__
+
+__all__ = ["__version__"]
+''',
+    "src/videomilker/cli": b'''"""CLI interface components."""
+
+from .menu_system import MenuSystem
+from .menu_renderer import MenuRenderer
+
+__all__ = ["MenuSystem", "MenuRenderer"]
+''',
+}
+
+_DEFAULT_INIT_CONTENT = b'"""Package initialization."""\n'
+
+_LICENSE_TEMPLATE = string.Template(
+    """MIT License
+
+Copyright (c) $year VideoMilker Team
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+)
+
+_LICENSE_CONTENT = _LICENSE_TEMPLATE.substitute(year=_CURRENT_YEAR).encode("utf-8")
+
+_DEFAULT_CONFIG = {
+    "version": "1.0.0",
+    "download": {
+        "path": None,  # filled in with the user's home directory
+        "create_day_folders": True,
+        "file_naming": "%(upload_date)s_%(title)s",
+        "default_quality": "best",
+        "default_format": "mp4",
+        "max_concurrent": 3,
+        "auto_subtitle": False,
+        "save_thumbnail": False,
+    },
+    "ui": {"theme": "default", "show_progress_details": True, "confirm_before_quit": True, "clear_screen": True},
+    "history": {"max_entries": 1000, "auto_cleanup": True, "cleanup_days": 30},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _render_default_config(home: str) -> bytes:
+    """Serialize the default config for the given home directory."""
+    config = {**_DEFAULT_CONFIG, "download": {**_DEFAULT_CONFIG["download"], "path": f"{home}/Downloads/VideoMilker"}}
+    return json.dumps(config, indent=2).encode("utf-8")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+class ProjectSetup:
+    """Handles the creation of project directory structure and initial files."""
+
+    def __init__(self, root_path: Path, force: bool = False, dry_run: bool = False):
+        # abspath() normalizes without the per-component readlink walk that resolve() does
+        self.root_path = Path(os.path.abspath(root_path))
+        self._root_prefix = str(self.root_path) + os.sep
+        self.force = force
+        self.dry_run = dry_run
+        self.created_files = []
+        self.created_dirs = []
+        self._log_buffer: List[str] = []
+        self._home_str = str(Path.home())
+
+    def create_directory_structure(self) -> None:
+        """Create the complete directory structure."""
+        # The root is the only directory whose ancestors may be missing
+        if not self.dry_run:
+            os.makedirs(self.root_path, exist_ok=True)
+
+        # Create each directory exactly once, parents before children, so every
+        # entry needs a single mkdir with no ancestor checks
+        unique_dirs = {PurePosixPath(directory) for directory in _DIRECTORIES}
+        unique_dirs.update(parent for directory in _DIRECTORIES for parent in PurePosixPath(directory).parents[:-1])
+
+        for directory in sorted(unique_dirs, key=lambda p: (len(p.parts), p.as_posix())):
+            self._create_directory(directory.as_posix())
+
+    def create_initial_files(self) -> None:
+        """Create initial project files with basic content."""
+        self._flush_pending(self._collect_initial_files())
+
+    def _collect_initial_files(self) -> List[Tuple[str, bytes]]:
+        """Collect every (path, content) pair that the setup run writes."""
+
+        pending = [
+            # Root level files
+            (".gitignore", self._get_gitignore_content()),
+            ("README.md", self._get_readme_content()),
+            ("requirements.txt", self._get_requirements_content()),
+            ("setup.py", self._get_setup_py_content()),
+            ("pyproject.toml", self._get_pyproject_content()),
+            ("LICENSE", self._get_license_content()),
+        ]
+
+        # Python __init__.py files
+        pending.extend((init_file, self._get_init_content(init_file)) for init_file in _INIT_FILES)
+
+        pending.extend(
+            [
+                # Main application files
+                ("src/videomilker/main.py", self._get_main_py_content()),
+                ("src/videomilker/version.py", self._get_version_content()),
+                # CLI module files
+                ("src/videomilker/cli/menu_system.py", self._get_menu_system_content()),
+                ("src/videomilker/cli/menu_renderer.py", self._get_menu_renderer_content()),
+                ("src/videomilker/cli/styles.py", self._get_styles_content()),
+                # Core module files
+                ("src/videomilker/core/downloader.py", self._get_downloader_content()),
+                ("src/videomilker/core/file_manager.py", self._get_file_manager_content()),
+                # Configuration files
+                ("src/videomilker/config/settings.py", self._get_settings_content()),
+                ("config/default_config.json", self._get_default_config_content()),
+                # Test configuration
+                ("tests/conftest.py", self._get_conftest_content()),
+                # Documentation files
+                ("docs/README.md", self._get_docs_readme_content()),
+                ("docs/installation.md", self._get_installation_content()),
+                # Data placeholder files
+                ("data/downloads/.gitkeep", b""),
+                ("data/history/.gitkeep", b""),
+                ("data/logs/.gitkeep", b""),
+                ("data/temp/.gitkeep", b""),
+            ]
+        )
+
+        return pending
+
+    def _flush_pending(self, pending: List[Tuple[str, bytes]]) -> None:
+        """Write all collected files, overlapping the writes on a thread pool."""
+        if self.dry_run:
+            for path, content in pending:
+                self._create_file(path, content)
+            return
+
+        # On re-runs, one directory listing per target directory replaces a
+        # failed open() per existing file
+        existing = set() if self.force else self._existing_entries(pending)
+        to_write = [(path, content) for path, content in pending if path not in existing]
+
+        # os.write releases the GIL so the writes overlap
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            written = executor.map(lambda item: self._write_file(*item), to_write)
+            results = dict(zip((path for path, _ in to_write), written, strict=True))
+
+        # Record in the original order to keep the log deterministic
+        for path, _ in pending:
+            self._record_write(results.get(path) or (None, f"• File exists (skipping): {path}"))
+
+    def _existing_entries(self, pending: List[Tuple[str, bytes]]) -> Set[str]:
+        """List each target directory once and return the relative paths that already exist."""
+        existing = set()
+
+        for directory in {path.rpartition("/")[0] for path, _ in pending}:
+            prefix = f"{directory}/" if directory else ""
+            try:
+                with os.scandir(self._root_prefix + directory) as entries:
+                    existing.update(prefix + entry.name for entry in entries)
+            except FileNotFoundError:
+                continue
+
+        return existing
+
+    def _create_directory(self, path: str) -> None:
+        """Create a directory if it doesn't exist."""
+        full_path = self._root_prefix + path
+
+        if self.dry_run:
+            self._log(f"[DRY RUN] Would create directory: {full_path}")
+            return
+
+        try:
+            os.mkdir(full_path)
+        except FileExistsError:
+            self._log(f"• Directory exists: {path}")
+            return
+
+        self.created_dirs.append(full_path)
+        self._log(f" Created directory: {path}")
+
+    def _create_file(self, path: str, content: bytes) -> None:
+        """Create a file with the given content."""
+        full_path = self._root_prefix + path
+
+        if self.dry_run:
+            self._log(f"[DRY RUN] Would create file: {full_path}")
+            return
+
+        self._record_write(self._write_file(path, content))
+
+    def _write_file(self, path: str, content: bytes) -> Tuple[Optional[str], str]:
+        """Write a file and return its full path (None if not written) and a log message.
+
+        Safe to call from worker threads: it touches no shared state.
+        """
+        full_path = self._root_prefix + path
+
+        # Let the kernel decide whether the file exists; parents were created
+        # by create_directory_structure
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if self.force else os.O_EXCL)
+
+        try:
+            fd = os.open(full_path, flags, 0o644)
+        except FileExistsError:
+            return None, f"• File exists (skipping): {path}"
+        except Exception as e:
+            return None, f" Failed to create {path}: {e}"
+
+        try:
+            _write_all(fd, content)
+            return full_path, f" Created file: {path}"
+        except Exception as e:
+            return None, f" Failed to create {path}: {e}"
+        finally:
+            os.close(fd)
+
+    def _record_write(self, result: Tuple[Optional[str], str]) -> None:
+        """Record the outcome of a _write_file call."""
+        full_path, message = result
+        if full_path is not None:
+            self.created_files.append(full_path)
+        self._log(message)
+
+    def _log(self, message: str) -> None:
+        """Queue a progress message for the next flush."""
+        self._log_buffer.append(message)
+
+    def _flush_log(self) -> None:
+        """Write all queued progress messages in a single call."""
+        if self._log_buffer:
+            print("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    # Content generation methods
+    def _get_gitignore_content(self) -> bytes:
+        return _GITIGNORE_CONTENT
+
+    def _get_readme_content(self) -> bytes:
+        return _README_CONTENT
+
+    def _get_requirements_content(self) -> bytes:
+        return _REQUIREMENTS_CONTENT
+
+    def _get_setup_py_content(self) -> bytes:
+        return _SETUP_PY_CONTENT
+
+    def _get_pyproject_content(self) -> bytes:
+        return _PYPROJECT_CONTENT
+
+    def _get_license_content(self) -> bytes:
+        return _LICENSE_CONTENT
+
+    def _get_init_content(self, file_path: str) -> bytes:
+        """Generate appropriate __init__.py content based on the module."""
+        return _INIT_CONTENTS.get(file_path.rpartition("/")[0], _DEFAULT_INIT_CONTENT)
+
+    def _get_main_py_content(self) -> bytes:
+        return _MAIN_PY_CONTENT
+
+    def _get_version_content(self) -> bytes:
+        return _VERSION_CONTENT
+
+    def _get_menu_system_content(self) -> bytes:
+        return _MENU_SYSTEM_CONTENT
+
+    def _get_menu_renderer_content(self) -> bytes:
+        return _MENU_RENDERER_CONTENT
+
+    def _get_default_config_content(self) -> bytes:
+        return _render_default_config(self._home_str)
+
+    def _get_conftest_content(self) -> bytes:
+        return _CONFTEST_CONTENT
+
+    def _get_docs_readme_content(self) -> bytes:
+        return _DOCS_README_CONTENT
+
+    def _get_installation_content(self) -> bytes:
+        return _INSTALLATION_CONTENT
+
+    def run_setup(self) -> None:
+        """Run the complete project setup."""
+        print(" Setting up VideoMilker project structure...")
+        print(f"Root directory: {self.root_path}")
+        print()
+
+        try:
+            # Create directory structure
+            print(" Creating directory structure...")
+            self.create_directory_structure()
+            self._flush_log()
+            print()
+
+            # Create files
+            print(" Creating initial files...")
+            self.create_initial_files()
+            self._flush_log()
+            print()
+
+            # Summary
+            print(" Project setup completed successfully!")
+            print(f"Created {len(self.created_dirs)} directories")
+            print(f"Created {len(self.created_files)} files")
+
+            if not self.dry_run:
+                print()
+                print(" Next Steps:")
+                print("1. Navigate to the project directory:")
+                print(f"   cd {self.root_path}")
+                print("2. Activate virtual environment:")
+                print("   source .venv/bin/activate  # Linux/Mac")
+                print("   .venv\\Scripts\\activate     # Windows")
+                print("3. Install dependencies:")
+                print("   pip install -r requirements.txt")
+                print("4. Run the application:")
+                print("   python -m src.videomilker.main")
+
+        except Exception as e:
+            self._flush_log()
+            print(f" Setup failed: {e}")
+            if self.dry_run:
+                print("(This was a dry run - no files were actually created)")
+            sys.exit(1)
+
+    def _get_styles_content(self) -> bytes:
+        """Generate content for the styles module."""
+        return _STYLES_CONTENT
+
+    def _get_downloader_content(self) -> bytes:
+        """Generate content for the downloader module."""
+        return _DOWNLOADER_CONTENT
+
+    def _get_file_manager_content(self) -> bytes:
+        """Generate content for the file manager module."""
+        return _FILE_MANAGER_CONTENT
+
+    def _get_settings_content(self) -> bytes:
+        """Generate content for the settings module."""
+        return _SETTINGS_CONTENT
+
 
 def main():
     """Main function to run the setup script."""
@@ -6,6 +6,31 @@ from typing import List
 from typing import Optional
 
 
+# Compiled once at import instead of on every call
+_URL_PATTERN = re.compile(
+    r"^https?://"  # http:// or https://
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
+    r"localhost|"  # localhost...
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
+    r"(?::\d+)?"  # optional port
+    r"(?:/?|[/?]\S+)$",
+    re.IGNORECASE,
+)
+# Comment lines match the first branch (empty group); URLs elsewhere match the group
+_URL_OR_COMMENT_PATTERN = re.compile(r"^[^\S\n]*#[^\n]*|(https?://[^\s]+)", re.MULTILINE)
+_URL_FIND_PATTERN = re.compile(r"https?://[^\s]+")
+_CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x1f\x7f]")
+_INVALID_FILENAME_PATTERN = re.compile(r'[<>:"/\\|?*]')
+_FILENAME_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+_ASCII_DIGITS = frozenset("0123456789")
+_TIME_UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1}
+
+_VALID_QUALITIES = frozenset(
+    {"best", "worst", "720p", "1080p", "480p", "360p", "audio_only", "video_only", "bestvideo", "bestaudio"}
+)
+_VALID_FORMATS = frozenset({"mp4", "mkv", "webm", "avi", "mov", "m4a", "mp3", "opus", "aac", "flac"})
+
+
 class InputHandler:
     """Handles user input processing and validation."""
 
@@ -19,17 +44,7 @@ class InputHandler:
             return False
 
         # Basic URL validation
-        url_pattern = re.compile(
-            r"^https?://"  # http:// or https://
-            r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
-            r"localhost|"  # localhost...
-            r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
-            r"(?::\d+)?"  # optional port
-            r"(?:/?|[/?]\S+)$",
-            re.IGNORECASE,
-        )
-
-        return bool(url_pattern.match(url))
+        return bool(_URL_PATTERN.match(url))
 
     def validate_path(self, path: str) -> bool:
         """Validate if a path is valid."""
@@ -45,32 +60,29 @@ class InputHandler:
             return False
 
         # Check for invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        return all(char not in filename for char in invalid_chars)
+        return _INVALID_FILENAME_PATTERN.search(filename) is None
 
     def parse_urls_from_text(self, text: str) -> List[str]:
         """Parse URLs from text input."""
-        urls = []
-
-        # Split by lines and extract URLs
-        lines = text.strip().split("\n")
+        # Single scan over the whole text, skipping comment lines
+        urls = _URL_OR_COMMENT_PATTERN.findall(text)
 
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith("#"):  # Skip comments
-                # Extract URLs from the line
-                url_matches = re.findall(r"https?://[^\s]+", line)
-                urls.extend(url_matches)
-
-        return list(set(urls))  # Remove duplicates
+        # Remove duplicates, keeping first-seen order
+        return list(dict.fromkeys(url for url in urls if url))
 
     def parse_batch_file(self, file_path: Path) -> List[str]:
         """Parse URLs from a batch file."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Stream the file instead of reading it whole; dict keys dedupe in order
+            urls = {}
+            with open(file_path, "r", encoding="utf-8", buffering=1 << 20) as f:
+                for line in f:
+                    if line.lstrip().startswith("#"):  # Skip comments
+                        continue
+                    for url in _URL_FIND_PATTERN.findall(line):
+                        urls[url] = None
 
-            return self.parse_urls_from_text(content)
+            return list(urls)
 
         except Exception as e:
             raise ValueError(f"Failed to read batch file: {e}") from e
@@ -81,7 +93,7 @@ class InputHandler:
             return ""
 
         # Remove control characters
-        sanitized = re.sub(r"[\x00-\x1f\x7f]", "", input_text)
+        sanitized = _CONTROL_CHARS_PATTERN.sub("", input_text)
 
         # Trim whitespace
         sanitized = sanitized.strip()
@@ -90,28 +102,13 @@ class InputHandler:
 
     def parse_quality_setting(self, quality: str) -> Optional[str]:
         """Parse and validate quality setting."""
-        valid_qualities = [
-            "best",
-            "worst",
-            "720p",
-            "1080p",
-            "480p",
-            "360p",
-            "audio_only",
-            "video_only",
-            "bestvideo",
-            "bestaudio",
-        ]
-
         quality_lower = quality.lower()
-        return quality_lower if quality_lower in valid_qualities else None
+        return quality_lower if quality_lower in _VALID_QUALITIES else None
 
     def parse_format_setting(self, format_str: str) -> Optional[str]:
         """Parse and validate format setting."""
-        valid_formats = ["mp4", "mkv", "webm", "avi", "mov", "m4a", "mp3", "opus", "aac", "flac"]
-
         format_lower = format_str.lower()
-        return format_lower if format_lower in valid_formats else None
+        return format_lower if format_lower in _VALID_FORMATS else None
 
     def parse_number_input(
         self, input_text: str, min_value: Optional[int] = None, max_value: Optional[int] = None
@@ -169,12 +166,8 @@ class InputHandler:
         if not title:
             return f"video.{extension}"
 
-        # Remove invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', "_", title)
-
-        # Limit length
-        if len(filename) > 100:
-            filename = filename[:100]
+        # Replace invalid characters and limit length
+        filename = title.translate(_FILENAME_SANITIZE_TABLE)[:100]
 
         # Add extension if not present
         if not filename.endswith(f".{extension}"):
@@ -195,18 +188,26 @@ class InputHandler:
         except ValueError:
             pass
 
-        # Parse time format (e.g., "1h 30m 45s")
-        total_seconds = 0
-
-        if hour_match := re.search(r"(\d+)h", time_input):
-            total_seconds += int(hour_match[1]) * 3600
-
-        if minute_match := re.search(r"(\d+)m", time_input):
-            total_seconds += int(minute_match[1]) * 60
-
-        if second_match := re.search(r"(\d+)s", time_input):
-            total_seconds += int(second_match[1])
-
+        # Parse time format (e.g., "1h 30m 45s") in one pass; the first
+        # number directly followed by each unit wins
+        unit_values = {}
+        length = len(time_input)
+        i = 0
+        while i < length:
+            if time_input[i] not in _ASCII_DIGITS:
+                i += 1
+                continue
+
+            j = i + 1
+            while j < length and time_input[j] in _ASCII_DIGITS:
+                j += 1
+
+            unit = time_input[j] if j < length else ""
+            if unit in _TIME_UNIT_SECONDS and unit not in unit_values:
+                unit_values[unit] = int(time_input[i:j])
+            i = j + 1
+
+        total_seconds = sum(value * _TIME_UNIT_SECONDS[unit] for unit, value in unit_values.items())
         return total_seconds if total_seconds > 0 else None
 
     def format_time(self, seconds: int) -> str:
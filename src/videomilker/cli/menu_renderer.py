@@ -1,34 +1,219 @@
 """Rich UI menu renderer for VideoMilker CLI."""
 
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
 from typing import Any
 
 from rich.box import DOUBLE
 from rich.box import ROUNDED
 from rich.box import SIMPLE
 from rich.console import Console
+from rich.console import Group
+from rich.console import RenderableType
 from rich.panel import Panel
-from rich.progress import BarColumn
-from rich.progress import Progress
-from rich.progress import SpinnerColumn
-from rich.progress import TextColumn
-from rich.progress import TimeElapsedColumn
 from rich.prompt import Confirm
+from rich.prompt import InvalidResponse
 from rich.prompt import Prompt
+from rich.rule import Rule
+from rich.table import Column
 from rich.table import Table
+from rich.text import Text
 
 from ..config.defaults import THEMES
 from ..config.settings import Settings
 from ..exceptions.download_errors import VideoMilkerError
 
 
+# rich.progress and rich.live are imported where used; most menu flows never show progress
+if TYPE_CHECKING:
+    from rich.live import Live
+    from rich.progress import Progress
+    from rich.progress import TaskID
+
+
+# Theme menu_style names mapped to Rich box styles; anything else falls back to ROUNDED
+_BOX_STYLES = {"double": DOUBLE, "single": SIMPLE, "rounded": ROUNDED}
+
+# Bytes-to-megabytes factor for the progress speed and size fields
+_MB = 1.0 / (1024 * 1024)
+
+# Accepted answers for the download confirmation prompt; Enter alone means yes
+_YN_AUTO = {"y": True, "yes": True, "": True, "auto": True, "n": False, "no": False}
+
+# Most menus built by show_menu that are kept for reuse
+_MENU_CACHE_SIZE = 64
+
+# Static panel titles, built once instead of parsing title markup on every panel
+_ERROR_TITLE = Text("Error", style="bold red")
+_SUCCESS_TITLE = Text("Success", style="bold green")
+_WARNING_TITLE = Text("Warning", style="bold yellow")
+_INFO_TITLE = Text("Information", style="bold cyan")
+_DOWNLOAD_PROGRESS_TITLE = Text("Download Progress", style="bold blue")
+_SETTINGS_TITLE = Text("Current Settings", style="bold blue")
+_HELP_TITLE = Text("Help & Information", style="bold green")
+
+# The banner never changes, so it is parsed once at import along with its trailing blank line
+_BANNER_MARKUP = """
+        [bold blue][/bold blue]
+        [bold blue]                                                              [/bold blue]
+        [bold blue]                    [white]VideoMilker v1.0[/white]                    [/bold blue]
+        [bold blue]                                                              [/bold blue]
+        [bold blue]              [yellow]An intuitive CLI for yt-dlp[/yellow]              [/bold blue]
+        [bold blue]                                                              [/bold blue]
+        [bold blue][/bold blue]
+        """
+_BANNER = Text.from_markup(_BANNER_MARKUP, justify="center")
+_BANNER_FRAME = Group(_BANNER, Text())
+
+# Keyboard shortcuts block appended under menus
+_SHORTCUTS_MARKUP = """
+            [dim]Keyboard Shortcuts:[/dim]
+            [dim]• Arrow keys: Navigate options[/dim]
+            [dim]• Enter: Select option[/dim]
+            [dim]• Ctrl+C: Cancel/Quit[/dim]
+            [dim]• Tab: Auto-complete[/dim]
+            """
+_SHORTCUTS_TEXT = Text.from_markup(_SHORTCUTS_MARKUP)
+
+# The help screen is static too, so the whole panel is built once
+_HELP_MARKUP = """
+        [bold]VideoMilker - Help[/bold]
+
+        [bold]Quick Download:[/bold]
+        Download a single video with default settings.
+
+        [bold]Batch Download:[/bold]
+        Download multiple videos from a list or file.
+
+        [bold]Options & Settings:[/bold]
+        Configure download paths, formats, and preferences.
+
+        [bold]Download History:[/bold]
+        View and manage your download history.
+
+        [bold]Navigation:[/bold]
+        • Use number keys to select options
+        • Press '0' to go back
+        • Press 'q' to quit
+        • Press Ctrl+C to cancel operations
+
+        [bold]Tips:[/bold]
+        • URLs are automatically validated
+        • Files are organized by date
+        • Progress is shown in real-time
+        • Errors are handled gracefully
+        """
+_HELP_PANEL = Panel(Text.from_markup(_HELP_MARKUP), title=_HELP_TITLE, border_style="green", box=ROUNDED)
+
+
+def _truncate(text: str, limit: int = 40) -> str:
+    """Shorten text to at most limit characters plus an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}…"
+
+
+# Shared ConfigManager, created on first use; only the "auto" answer needs it
+_CONFIG_MANAGER = None
+
+
+def _get_config_manager() -> Any:
+    """Return the process-wide ConfigManager, importing it on first use."""
+    global _CONFIG_MANAGER
+    if _CONFIG_MANAGER is None:
+        from ..config.config_manager import ConfigManager
+
+        _CONFIG_MANAGER = ConfigManager()
+    return _CONFIG_MANAGER
+
+
+class _RequiredPrompt(Prompt):
+    """Prompt that keeps asking until a non-blank answer is given."""
+
+    def process_response(self, value: str) -> str:
+        """Reject blank answers so the prompt asks again."""
+        value = super().process_response(value)
+        if not value.strip():
+            raise InvalidResponse(self.validate_error_message)
+        return value
+
+
 class MenuRenderer:
     """Renders beautiful Rich UI menus for VideoMilker."""
 
+    __slots__ = (
+        "_border_style",
+        "_box_style",
+        "_download_live",
+        "_download_progress",
+        "_download_tasks",
+        "_err_close",
+        "_err_open",
+        "_highlight_style",
+        "_hl_close",
+        "_hl_open",
+        "_info_close",
+        "_info_open",
+        "_interactive",
+        "_last_render_ts",
+        "_menu_cache",
+        "_min_render_interval",
+        "_render_hz",
+        "_rule",
+        "_select_prompt",
+        "_succ_close",
+        "_succ_open",
+        "_title_close",
+        "_title_open",
+        "_warn_close",
+        "_warn_open",
+        "console",
+        "settings",
+        "theme",
+    )
+
     def __init__(self, console: Console, settings: Settings | None = None):
         """Initialize the menu renderer."""
         self.console = console
         self.settings = settings
-        self.theme = self._get_theme()
+        self.refresh_theme()
+        self._download_live: "Live | None" = None
+        self._download_progress: "Progress | None" = None
+        self._download_tasks: "dict[str, TaskID]" = {}
+        self._render_hz = max(settings.ui.render_hz, 1) if settings else 30
+        self._min_render_interval = 1 / self._render_hz
+        self._last_render_ts = 0.0
+        # Without a terminal on stdin, confirmations and pauses take their defaults instead of prompting
+        self._interactive = sys.stdin is not None and sys.stdin.isatty()
+
+    def _flush(self, renderable: RenderableType) -> None:
+        """Print a finished frame with a single console.print call."""
+        self.console.print(renderable)
+
+    def refresh_theme(self) -> None:
+        """Load the current theme and precompute its markup open/close tags."""
+        theme = self.theme = self._get_theme()
+        # Styles read while rendering are kept as attributes rather than looked up in the theme dict
+        self._highlight_style = theme["highlight_style"]
+        self._border_style = theme["border_style"]
+        self._hl_open, self._hl_close = self._style_tags(self._highlight_style)
+        self._err_open, self._err_close = self._style_tags(theme["error_style"])
+        self._warn_open, self._warn_close = self._style_tags(theme["warning_style"])
+        self._succ_open, self._succ_close = self._style_tags(theme["success_style"])
+        self._info_open, self._info_close = self._style_tags(theme.get("info_style", "cyan"))
+        self._title_open, self._title_close = self._style_tags(f"bold {self._border_style}")
+        self._select_prompt = f"{self._hl_open}Select an option{self._hl_close}"
+        self._rule = Rule(style=self._border_style)
+        self._box_style = _BOX_STYLES.get(theme.get("menu_style", "rounded"), ROUNDED)
+        # Built menus depend on the theme, so each theme starts with an empty cache
+        self._menu_cache: OrderedDict[tuple, tuple[Panel, list[str]]] = OrderedDict()
+
+    @staticmethod
+    def _style_tags(style: str) -> tuple[str, str]:
+        """Return the markup tags that open and close a style."""
+        return f"[{style}]", f"[/{style}]"
 
     def _get_theme(self) -> dict[str, str]:
         """Get the current theme configuration."""
@@ -39,18 +224,7 @@ class MenuRenderer:
 
     def show_welcome_banner(self) -> None:
         """Display the welcome banner."""
-        banner_text = """
-        [bold blue][/bold blue]
-        [bold blue]                                                              [/bold blue]
-        [bold blue]                    [white]VideoMilker v1.0[/white]                    [/bold blue]
-        [bold blue]                                                              [/bold blue]
-        [bold blue]              [yellow]An intuitive CLI for yt-dlp[/yellow]              [/bold blue]
-        [bold blue]                                                              [/bold blue]
-        [bold blue][/bold blue]
-        """
-
-        self.console.print(banner_text, justify="center")
-        self.console.print()
+        self._flush(_BANNER_FRAME)
 
     def show_menu(
         self,
@@ -61,134 +235,140 @@ class MenuRenderer:
         extra_info: str = "",
     ) -> str:
         """Display a menu with options and return the user's choice."""
-        # Create menu panel
-        menu_content = []
+        # Menus are redrawn identically after most actions, so reuse the built panel
+        cache_key = (
+            title,
+            tuple((key, description) for key, (description, _) in options.items()),
+            back_option,
+            show_shortcuts,
+            extra_info,
+        )
+        cached = self._menu_cache.get(cache_key)
+        if cached is None:
+            cached = self._build_menu(title, options, back_option, show_shortcuts, extra_info)
+            self._menu_cache[cache_key] = cached
+            if len(self._menu_cache) > _MENU_CACHE_SIZE:
+                self._menu_cache.popitem(last=False)
+        else:
+            self._menu_cache.move_to_end(cache_key)
+        panel, valid_choices = cached
+
+        self._flush(panel)
+
+        # Prompt.ask rejects anything outside choices and re-asks on its own
+        return Prompt.ask(self._select_prompt, choices=valid_choices)
+
+    def _build_menu(
+        self,
+        title: str,
+        options: dict[str, tuple[str, Any]],
+        back_option: bool,
+        show_shortcuts: bool,
+        extra_info: str,
+    ) -> tuple[Panel, list[str]]:
+        """Build a menu panel and its list of valid choices."""
+        # Create menu panel from Text built directly, so menu entries skip the markup parser
+        menu_content: list[Text] = []
+        highlight_style = self._highlight_style
 
         for key, (description, _) in options.items():
             if key == "q":
-                menu_content.append(f"[red]{key}[/red] - {description}")
+                key_style = "red"
             elif key == "0" and back_option:
-                menu_content.append(f"[dim]{key}[/dim] - {description}")
+                key_style = "dim"
             else:
-                menu_content.append(
-                    f"[{self.theme['highlight_style']}]{key}[/{self.theme['highlight_style']}] - {description}"
-                )
+                key_style = highlight_style
+            menu_content.append(Text.assemble((key, key_style), f" - {description}"))
 
+        valid_choices = list(options)
         if back_option and "0" not in options:
-            menu_content.append("[dim]0[/dim] - ← Back")
+            menu_content.append(Text.assemble(("0", "dim"), " - ← Back"))
+            valid_choices.append("0")
 
         # Add extra info if provided
         if extra_info:
-            menu_content.append(extra_info)
+            menu_content.append(Text.from_markup(extra_info))
 
         # Add keyboard shortcuts info if enabled
         if show_shortcuts:
-            shortcuts_info = """
-            [dim]Keyboard Shortcuts:[/dim]
-            [dim]• Arrow keys: Navigate options[/dim]
-            [dim]• Enter: Select option[/dim]
-            [dim]• Ctrl+C: Cancel/Quit[/dim]
-            [dim]• Tab: Auto-complete[/dim]
-            """
-            menu_content.append(shortcuts_info)
-
-        menu_text = "\n".join(menu_content)
+            menu_content.append(_SHORTCUTS_TEXT)
 
         panel = Panel(
-            menu_text,
-            title=f"[bold {self.theme['border_style']}]{title}[/bold {self.theme['border_style']}]",
-            border_style=self.theme["border_style"],
-            box=self._get_box_style(),
+            Text("\n").join(menu_content),
+            title=f"{self._title_open}{title}{self._title_close}",
+            border_style=self._border_style,
+            box=self._box_style,
         )
-
-        self.console.print(panel)
-
-        # Get user input
-        while True:
-            choice = Prompt.ask(
-                f"[{self.theme['highlight_style']}]Select an option[/{self.theme['highlight_style']}]",
-                choices=list(options.keys()) + (["0"] if back_option and "0" not in options else []),
-            )
-
-            if choice in options or (choice == "0" and back_option):
-                return choice
-
-            self.console.print(
-                f"[{self.theme['error_style']}]Invalid option. Please try again.[/{self.theme['error_style']}]"
-            )
+        return panel, valid_choices
 
     def show_input_prompt(self, prompt: str, default: str = "", required: bool = True) -> str:
         """Display an input prompt."""
-        while True:
-            value = Prompt.ask(
-                f"[{self.theme['highlight_style']}]{prompt}[/{self.theme['highlight_style']}]", default=default
-            )
-
-            if not required or value.strip():
-                return value.strip()
+        prompt_text = f"{self._hl_open}{prompt}{self._hl_close}"
+        if not required:
+            return Prompt.ask(prompt_text, default=default, show_default=bool(default)).strip()
 
-            self.console.print(f"[{self.theme['error_style']}]This field is required.[/{self.theme['error_style']}]")
+        # Without a default, blank input reaches _RequiredPrompt's validation and is re-asked there
+        required_prompt = _RequiredPrompt(prompt_text, show_default=bool(default))
+        required_prompt.validate_error_message = f"{self._err_open}This field is required.{self._err_close}"
+        return required_prompt(default=default or ...).strip()
 
     def show_confirmation(self, message: str, default: bool = True) -> bool:
         """Display a confirmation dialog."""
-        return Confirm.ask(
-            f"[{self.theme['highlight_style']}]{message}[/{self.theme['highlight_style']}]", default=default
-        )
+        if not self._interactive:
+            return default
+        return Confirm.ask(f"{self._hl_open}{message}{self._hl_close}", default=default)
 
     def show_download_confirmation(self, message: str = "Start download?", auto_download: bool = False) -> bool:
         """Display a download confirmation dialog with auto option."""
         if auto_download:
-            self.console.print(
-                f"[{self.theme['success_style']}]Auto-download enabled - starting download...[/{self.theme['success_style']}]"
-            )
+            self.console.print(f"{self._succ_open}Auto-download enabled - starting download...{self._succ_close}")
+            return True
+        if not self._interactive:
             return True
 
-        # Show the confirmation prompt with auto option
-        prompt = f"[{self.theme['highlight_style']}]{message} [y/n/auto] (y):[/{self.theme['highlight_style']}]"
+        # Show the confirmation prompt with auto option; built once as plain Text so
+        # "[y/n/auto]" is shown literally instead of being parsed as a markup tag
+        prompt = Text(f"{message} [y/n/auto] (y): ", style=self._highlight_style)
 
         while True:
             try:
                 response = self.console.input(prompt).strip().lower()
             # Only catch EOFError, which occurs when input is unavailable (e.g., piped or redirected input)
             except EOFError:
-                self.console.print(
-                    f"[{self.theme['warning_style']}]Input unavailable - defaulting to 'yes'.[/{self.theme['warning_style']}]"
-                )
+                self.console.print(f"{self._warn_open}Input unavailable - defaulting to 'yes'.{self._warn_close}")
                 return True
-            
-            if response in ['y', 'yes', '']:
-                self.console.print(f"[{self.theme['success_style']}][ON] - Auto Start Downloads[/{self.theme['success_style']}]")
-            response = self.console.input(prompt).strip().lower()
 
-            if response in ["y", "yes", ""]:
-                return True
-            elif response in ["n", "no"]:
-                return False
-            elif response in ["auto"]:
+            answer = _YN_AUTO.get(response)
+            if answer is None:
+                self.console.print(f"{self._err_open}Invalid input. Please enter y, n, or auto.{self._err_close}")
+                continue
+
+            if response == "auto":
                 # Enable auto-download permanently
                 if self.settings:
                     self.settings.ui.auto_download = True
                     # Save the setting
                     try:
-                        from ..config.config_manager import ConfigManager
-
-                        config_manager = ConfigManager()
+                        config_manager = _get_config_manager()
+                        config_manager.settings = self.settings
                         config_manager.save_config()
-                        self.console.print(
-                            f"[{self.theme['success_style']}]Auto-download enabled permanently![/{self.theme['success_style']}]"
-                        )
+                        self.console.print(f"{self._succ_open}Auto-download enabled permanently!{self._succ_close}")
                     except Exception as e:
                         self.console.print(
-                            f"[{self.theme['warning_style']}]Warning: Could not save auto-download setting: {e}[/{self.theme['warning_style']}]"
+                            f"{self._warn_open}Warning: Could not save auto-download setting: {e}{self._warn_close}"
                         )
-                return True
-            else:
-                self.console.print(
-                    f"[{self.theme['error_style']}]Invalid input. Please enter y, n, or auto.[/{self.theme['error_style']}]"
-                )
+            elif answer:
+                self.console.print(f"{self._succ_open}[ON] - Auto Start Downloads{self._succ_close}")
+            return answer
 
-    def show_progress(self, description: str, total: int | None = None) -> Progress:
+    def show_progress(self, description: str, total: int | None = None) -> "Progress":
         """Create and display a progress bar."""
+        from rich.progress import BarColumn
+        from rich.progress import Progress
+        from rich.progress import SpinnerColumn
+        from rich.progress import TextColumn
+        from rich.progress import TimeElapsedColumn
+
         progress = Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -206,6 +386,14 @@ class MenuRenderer:
 
         return progress
 
+    @contextmanager
+    def download_progress(self) -> Iterator["MenuRenderer"]:
+        """Scope show_download_progress calls, stopping the live panel even if a download fails."""
+        try:
+            yield self
+        finally:
+            self.finish_download_progress()
+
     def show_download_progress(
         self,
         title: str,
@@ -214,34 +402,77 @@ class MenuRenderer:
         eta: float | None = None,
         size: int = 0,
         downloaded: int = 0,
+        force: bool = False,
     ) -> None:
-        """Display download progress with detailed information."""
-        progress_text = f"Progress: {'' * int(progress / 5)}{'' * (20 - int(progress / 5))} {progress:.1f}%"
-
-        if speed > 0:
-            speed_text = f"Speed: {speed / (1024 * 1024):.2f} MB/s"
-        else:
-            speed_text = "Speed: Calculating..."
+        """Display download progress, updating a live panel in place."""
+        # Drop updates that arrive faster than the redraw rate; a title's first
+        # update and its completion always go through
+        now = time.monotonic()
+        if (
+            not force
+            and progress < 100
+            and title in self._download_tasks
+            and now - self._last_render_ts < self._min_render_interval
+        ):
+            return
+        self._last_render_ts = now
 
+        speed_text = f"Speed: {speed * _MB:.2f} MB/s" if speed > 0 else "Speed: Calculating..."
         eta_text = f"ETA: {eta:.0f}s" if eta else "ETA: Calculating..."
         if size > 0:
-            size_text = f"Size: {downloaded / (1024 * 1024):.1f} MB / {size / (1024 * 1024):.1f} MB"
+            size_text = f"Size: {downloaded * _MB:.1f} MB / {size * _MB:.1f} MB"
         else:
             size_text = "Size: Unknown"
 
-        content = f"""
-        [bold]{title}[/bold]
-
-        {progress_text}
-        {speed_text}    {eta_text}
-        {size_text}
-
-        [dim]Press Ctrl+C to cancel[/dim]
-        """
-
-        panel = Panel(content, title="[bold blue]Download Progress[/bold blue]", border_style="blue", box=ROUNDED)
+        if self._download_progress is None:
+            self._start_download_progress()
+
+        # One task per title; later calls only update the existing task
+        task_id = self._download_tasks.get(title)
+        if task_id is None:
+            task_id = self._download_progress.add_task(title, total=100, speed="", eta="", size="")
+            self._download_tasks[title] = task_id
+        self._download_progress.update(task_id, completed=progress, speed=speed_text, eta=eta_text, size=size_text)
+
+        if self._download_progress.finished:
+            self.finish_download_progress()
+
+    def _start_download_progress(self) -> None:
+        """Create the live download panel shared by show_download_progress calls."""
+        from rich.live import Live
+        from rich.progress import BarColumn
+        from rich.progress import Progress
+        from rich.progress import SpinnerColumn
+        from rich.progress import TextColumn
+        from rich.progress import TimeElapsedColumn
+
+        self._download_progress = Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}", style="bold", markup=False),
+            BarColumn(bar_width=20),
+            TextColumn("{task.percentage:>5.1f}%"),
+            TextColumn("{task.fields[speed]}", markup=False),
+            TextColumn("{task.fields[eta]}", markup=False),
+            TextColumn("{task.fields[size]}", markup=False),
+            TimeElapsedColumn(),
+            console=self.console,
+        )
+        panel = Panel(
+            Group(self._download_progress, Text("Press Ctrl+C to cancel", style="dim")),
+            title=_DOWNLOAD_PROGRESS_TITLE,
+            border_style="blue",
+            box=ROUNDED,
+        )
+        self._download_live = Live(panel, console=self.console, refresh_per_second=self._render_hz)
+        self._download_live.start()
 
-        self.console.print(panel)
+    def finish_download_progress(self) -> None:
+        """Stop the live download panel, leaving its last frame on screen."""
+        if self._download_live is not None:
+            self._download_live.stop()
+        self._download_live = None
+        self._download_progress = None
+        self._download_tasks = {}
 
     def show_error(self, error: VideoMilkerError, details: str | None = None) -> None:
         """Display an error message."""
@@ -252,59 +483,61 @@ class MenuRenderer:
                 content += f"\n\n[dim]{error.details}[/dim]" if error.details else ""
                 content += f"\n\n[dim]{error.traceback}[/dim]" if error.traceback else ""
             else:
-                content = f"[{self.theme['error_style']}]{error}[/{self.theme['error_style']}]"
+                content = f"{self._err_open}{error}{self._err_close}"
 
             if details:
                 content += f"\n\n[dim]{details}[/dim]"
 
-            panel = Panel(content, title="[bold red]Error[/bold red]", border_style="red", box=ROUNDED)
+            panel = Panel(content, title=_ERROR_TITLE, border_style="red", box=ROUNDED)
 
-            self.console.print(panel)
+            self._flush(panel)
 
     def show_success(self, message: str) -> None:
         """Display a success message."""
         panel = Panel(
-            f"[{self.theme['success_style']}]{message}[/{self.theme['success_style']}]",
-            title="[bold green]Success[/bold green]",
+            f"{self._succ_open}{message}{self._succ_close}",
+            title=_SUCCESS_TITLE,
             border_style="green",
             box=ROUNDED,
         )
 
-        self.console.print(panel)
+        self._flush(panel)
 
     def show_warning(self, message: str) -> None:
         """Display a warning message."""
         panel = Panel(
-            f"[{self.theme['warning_style']}]{message}[/{self.theme['warning_style']}]",
-            title="[bold yellow]Warning[/bold yellow]",
+            f"{self._warn_open}{message}{self._warn_close}",
+            title=_WARNING_TITLE,
             border_style="yellow",
             box=ROUNDED,
         )
 
-        self.console.print(panel)
+        self._flush(panel)
 
     def show_info(self, message: str) -> None:
         """Display an info message."""
         panel = Panel(
-            f"[{self.theme.get('info_style', 'cyan')}]{message}[/{self.theme.get('info_style', 'cyan')}]",
-            title="[bold cyan]Information[/bold cyan]",
+            f"{self._info_open}{message}{self._info_close}",
+            title=_INFO_TITLE,
             border_style="cyan",
             box=ROUNDED,
         )
 
-        self.console.print(panel)
+        self._flush(panel)
 
     def show_table(self, title: str, headers: list[str], rows: list[list[str]]) -> None:
         """Display a table."""
-        table = Table(title=title, border_style=self.theme["border_style"])
-
-        for header in headers:
-            table.add_column(header, style=self.theme["highlight_style"])
+        highlight_style = self._highlight_style
+        table = Table(
+            *(Column(header, style=highlight_style) for header in headers),
+            title=title,
+            border_style=self._border_style,
+        )
 
         for row in rows:
             table.add_row(*row)
 
-        self.console.print(table)
+        self._flush(table)
 
     def show_download_summary(self, downloads: list[dict[str, Any]]) -> None:
         """Display a summary of downloads."""
@@ -312,25 +545,22 @@ class MenuRenderer:
             self.show_info("No downloads to display.")
             return
 
-        table = Table(title="Download Summary", border_style=self.theme["border_style"])
+        table = Table(title="Download Summary", border_style=self._border_style)
         table.add_column("Title", style="green", no_wrap=True)
         table.add_column("Status", style="yellow")
         table.add_column("Size", style="blue")
         table.add_column("Duration", style="magenta")
 
         for download in downloads:
-            title = (
-                download.get("title", "Unknown")[:40] + "..."
-                if len(download.get("title", "")) > 40
-                else download.get("title", "Unknown")
+            size_mb = download.get("size_mb")
+            table.add_row(
+                _truncate(download.get("title") or "Unknown"),
+                download.get("status", "unknown"),
+                f"{size_mb:.1f} MB" if size_mb else "Unknown",
+                str(download.get("duration") or "Unknown"),
             )
-            status = download.get("status", "unknown")
-            size = f"{download.get('size_mb', 0):.1f} MB" if download.get("size_mb") else "Unknown"
-            duration = str(download.get("duration", "Unknown"))
-
-            table.add_row(title, status, size, duration)
 
-        self.console.print(table)
+        self._flush(table)
 
     def show_settings(self, settings: Settings) -> None:
         """Display current settings."""
@@ -354,54 +584,17 @@ class MenuRenderer:
         Cleanup Days: {settings.history.cleanup_days}
         """
 
-        panel = Panel(content, title="[bold blue]Current Settings[/bold blue]", border_style="blue", box=ROUNDED)
+        panel = Panel(content, title=_SETTINGS_TITLE, border_style="blue", box=ROUNDED)
 
-        self.console.print(panel)
+        self._flush(panel)
 
     def show_help(self) -> None:
         """Display help information."""
-        help_text = """
-        [bold]VideoMilker - Help[/bold]
-
-        [bold]Quick Download:[/bold]
-        Download a single video with default settings.
-
-        [bold]Batch Download:[/bold]
-        Download multiple videos from a list or file.
-
-        [bold]Options & Settings:[/bold]
-        Configure download paths, formats, and preferences.
-
-        [bold]Download History:[/bold]
-        View and manage your download history.
-
-        [bold]Navigation:[/bold]
-        • Use number keys to select options
-        • Press '0' to go back
-        • Press 'q' to quit
-        • Press Ctrl+C to cancel operations
-
-        [bold]Tips:[/bold]
-        • URLs are automatically validated
-        • Files are organized by date
-        • Progress is shown in real-time
-        • Errors are handled gracefully
-        """
-
-        panel = Panel(help_text, title="[bold green]Help & Information[/bold green]", border_style="green", box=ROUNDED)
-
-        self.console.print(panel)
+        self._flush(_HELP_PANEL)
 
     def _get_box_style(self) -> Any:
         """Get the box style based on theme."""
-        style = self.theme.get("menu_style", "rounded")
-
-        if style == "double":
-            return DOUBLE
-        elif style == "single":
-            return SIMPLE
-        else:
-            return ROUNDED
+        return self._box_style
 
     def clear_screen(self) -> None:
         """Clear the console screen."""
@@ -409,9 +602,10 @@ class MenuRenderer:
 
     def show_pause(self) -> None:
         """Display a pause prompt."""
-        self.console.print()
-        Prompt.ask(f"[{self.theme['highlight_style']}]Press Enter to continue[/{self.theme['highlight_style']}]")
+        if not self._interactive:
+            return
+        Prompt.ask(f"\n{self._hl_open}Press Enter to continue{self._hl_close}")
 
     def show_separator(self) -> None:
         """Display a separator line."""
-        self.console.print(f"[{self.theme['border_style']}][/{self.theme['border_style']}]" * 80)
+        self._flush(self._rule)
@@ -3209,6 +3209,7 @@ Download multiple videos with advanced queue management and processing options.
 
         if theme_choice in theme_options:
             self.settings.ui.theme = theme_options[theme_choice]
+            self.renderer.refresh_theme()
 
         # Auto download
         auto_download = self.renderer.show_confirmation(
@@ -3694,6 +3695,7 @@ Download multiple videos with advanced queue management and processing options.
         theme_choice = self.renderer.show_menu("Select Theme", theme_options)
         if theme_choice in theme_options and theme_choice != "0":
             self.settings.ui.theme = theme_options[theme_choice][1]
+            self.renderer.refresh_theme()
             self.renderer.show_success(f"Theme set to: {theme_options[theme_choice][1]}")
 
         # Save configuration
@@ -278,6 +278,10 @@ class ConfigManager:
         if ui_settings.menu_style not in valid_menu_styles:
             errors.append(f"Invalid menu style '{ui_settings.menu_style}'. Must be one of: {valid_menu_styles}")
 
+        # Validate progress redraw rate
+        if ui_settings.render_hz < 1 or ui_settings.render_hz > 120:
+            errors.append("Render rate must be between 1 and 120 redraws per second")
+
         return errors
 
     def _validate_history_settings(self, history_settings) -> List[str]:
@@ -46,6 +46,7 @@ DEFAULT_CONFIG = {
         "success_style": "green",
         "warning_style": "yellow",
         "auto_download": False,
+        "render_hz": 30,
     },
     "history": {
         "max_entries": 1000,
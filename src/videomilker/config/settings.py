@@ -54,6 +54,7 @@ class UISettings(BaseModel):
     success_style: str = Field(default="green", description="Success color")
     warning_style: str = Field(default="yellow", description="Warning color")
     auto_download: bool = Field(default=False, description="Automatically start downloads without confirmation")
+    render_hz: int = Field(default=30, description="Maximum download progress redraws per second")
 
 
 class HistorySettings(BaseModel):
@@ -6,10 +6,12 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+import pytest
 from rich.console import Console
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+from videomilker.cli import menu_renderer
 from videomilker.cli.input_handler import InputHandler
 from videomilker.cli.menu_renderer import MenuRenderer
 from videomilker.config.config_manager import ConfigManager
@@ -78,3 +80,148 @@ def test_input_handler_validation_and_suggestions():
     assert filename.endswith(".mp4")
     assert "Test Video Title" in filename
 
+
+def test_input_handler_parses_urls_in_order_skipping_comments():
+    handler = InputHandler()
+    text = "https://a.example/1 https://b.example/2\n  # https://c.example/3\nhttps://a.example/1\n"
+
+    assert handler.parse_urls_from_text(text) == ["https://a.example/1", "https://b.example/2"]
+
+
+def test_input_handler_parses_time_input():
+    handler = InputHandler()
+
+    assert handler.parse_time_input("5400") == 5400
+    assert handler.parse_time_input("1h 30m 45s") == 5445
+    assert handler.parse_time_input("2m") == 120
+    assert handler.parse_time_input("soon") is None
+
+
+def test_input_handler_parses_batch_file(tmp_path):
+    handler = InputHandler()
+    batch_file = tmp_path / "urls.txt"
+    batch_file.write_text("# list\nhttps://a.example/1\n\nhttps://b.example/2 https://a.example/1\n", encoding="utf-8")
+
+    assert handler.parse_batch_file(batch_file) == ["https://a.example/1", "https://b.example/2"]
+
+
+def test_menu_renderer_download_confirmation_reads_input_once(monkeypatch):
+    console = Console(record=True, file=io.StringIO())
+    renderer = MenuRenderer(console, Settings())
+    renderer._interactive = True
+    responses = iter(["maybe", "n"])
+    prompts = []
+
+    def fake_input(prompt):
+        prompts.append(prompt)
+        return next(responses)
+
+    monkeypatch.setattr(console, "input", fake_input)
+
+    assert renderer.show_download_confirmation("Start download?") is False
+    assert len(prompts) == 2
+    assert "[y/n/auto]" in prompts[0].plain
+
+
+def test_menu_renderer_skips_prompts_when_not_interactive(monkeypatch):
+    console = Console(file=io.StringIO())
+    renderer = MenuRenderer(console, Settings())
+    renderer._interactive = False
+    monkeypatch.setattr(console, "input", lambda *args, **kwargs: pytest.fail("prompted without a terminal"))
+
+    assert renderer.show_confirmation("Continue?", default=False) is False
+    assert renderer.show_download_confirmation() is True
+    renderer.show_pause()
+
+
+def test_menu_renderer_download_progress_updates_one_live_panel():
+    console = Console(record=True, file=io.StringIO(), width=120)
+    renderer = MenuRenderer(console, Settings())
+
+    renderer.show_download_progress("clip", 40.0, size=1024 * 1024, downloaded=400 * 1024)
+    assert len(renderer._download_tasks) == 1
+
+    renderer.show_download_progress("clip", 100.0, size=1024 * 1024, downloaded=1024 * 1024)
+    assert renderer._download_live is None
+    output = console.export_text()
+    assert "100.0%" in output
+    assert "Size: 1.0 MB / 1.0 MB" in output
+
+
+def test_menu_renderer_download_progress_throttles_updates():
+    console = Console(record=True, file=io.StringIO(), width=120)
+    renderer = MenuRenderer(console, Settings())
+    renderer._min_render_interval = 60.0
+
+    renderer.show_download_progress("clip", 10.0)
+    renderer.show_download_progress("clip", 20.0)
+    task = renderer._download_progress.tasks[0]
+    assert task.completed == 10.0
+
+    renderer.show_download_progress("clip", 30.0, force=True)
+    assert task.completed == 30.0
+    renderer.finish_download_progress()
+
+
+def test_menu_renderer_download_progress_stops_on_error():
+    console = Console(record=True, file=io.StringIO(), width=120)
+    renderer = MenuRenderer(console, Settings())
+
+    with pytest.raises(RuntimeError), renderer.download_progress():
+        renderer.show_download_progress("clip", 40.0)
+        live = renderer._download_live
+        assert live.is_started
+        raise RuntimeError("download failed")
+
+    assert not live.is_started
+    assert renderer._download_live is None
+    assert not renderer._download_tasks
+
+
+def test_menu_renderer_auto_answer_saves_renderer_settings(tmp_path, monkeypatch):
+    config_manager = ConfigManager(config_dir=tmp_path)
+    monkeypatch.setattr(menu_renderer, "_CONFIG_MANAGER", config_manager)
+    console = Console(record=True, file=io.StringIO())
+    settings = Settings()
+    renderer = MenuRenderer(console, settings)
+    renderer._interactive = True
+    monkeypatch.setattr(console, "input", lambda prompt: "auto")
+
+    assert renderer.show_download_confirmation() is True
+    assert ConfigManager(config_dir=tmp_path).load_config().ui.auto_download is True
+
+
+def test_menu_renderer_required_input_reasks_on_blank(monkeypatch):
+    renderer = MenuRenderer(Console(file=io.StringIO()), Settings())
+    answers = iter(["", "   ", " value "])
+    monkeypatch.setattr(
+        menu_renderer._RequiredPrompt, "get_input", classmethod(lambda cls, *args, **kwargs: next(answers))
+    )
+
+    assert renderer.show_input_prompt("Name") == "value"
+
+
+def test_menu_renderer_reuses_cached_menu_panel(monkeypatch):
+    console = Console(record=True, file=io.StringIO())
+    renderer = MenuRenderer(console, Settings())
+    monkeypatch.setattr(menu_renderer.Prompt, "ask", lambda *args, **kwargs: "1")
+    options = {"1": ("One", None)}
+
+    assert renderer.show_menu("Menu", options) == "1"
+    assert renderer.show_menu("Menu", dict(options)) == "1"
+    assert len(renderer._menu_cache) == 1
+
+    renderer.refresh_theme()
+    assert not renderer._menu_cache
+
+
+def test_menu_renderer_download_summary_handles_missing_fields():
+    console = Console(record=True, file=io.StringIO(), width=120)
+    renderer = MenuRenderer(console, Settings())
+
+    renderer.show_download_summary([{"title": None, "duration": None}, {"title": "t" * 50, "size_mb": 1.5}])
+    output = console.export_text()
+
+    assert "None" not in output
+    assert "t" * 40 + "…" in output
+    assert "1.5 MB" in output